@@ -1,3 +1,10 @@
-from .server import MonumentenMCP
+__all__ = ["MonumentenMCP"]
 
-__all__ = ["MonumentenMCP"]
\ No newline at end of file
+
+def __getattr__(name):
+    # Import the server lazily so the CLI can parse arguments without loading its dependencies
+    if name == "MonumentenMCP":
+        from .server import MonumentenMCP
+
+        return MonumentenMCP
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -12,12 +12,13 @@ python -m mcp_monumenten
 import argparse
 import asyncio
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 
-from dotenv import load_dotenv
-
-from mcp_monumenten.server import MonumentenMCP
+# Background thread writing queued log records; started by setup_logging
+_log_listener: logging.handlers.QueueListener | None = None
 
 
 def setup_logging(transport_mode: str = "stdio"):
@@ -28,7 +29,15 @@ def setup_logging(transport_mode: str = "stdio"):
     # In stdio mode, we must use stderr to avoid interfering with protocol
     # In HTTP mode, we can be more flexible
     if transport_mode == "stdio":
-        handler = logging.StreamHandler(sys.stderr)
+        # Line-buffer explicitly so each record is a single write, whatever stderr is redirected to
+        try:
+            stream = os.fdopen(
+                sys.stderr.fileno(), "w", buffering=1, encoding="utf-8", errors="replace", closefd=False
+            )
+        except (AttributeError, OSError, ValueError):
+            # stderr has been replaced by an object without a file descriptor
+            stream = sys.stderr
+        handler = logging.StreamHandler(stream)
         # More minimal format for stdio mode
         formatter = logging.Formatter("%(levelname)s: %(message)s")
     else:
@@ -40,18 +49,28 @@ def setup_logging(transport_mode: str = "stdio"):
 
     handler.setFormatter(formatter)
 
-    # Configure root logger
-    logging.basicConfig(
-        level=getattr(logging, log_level, logging.INFO), handlers=[handler], force=True
-    )
+    # Coroutines only enqueue records; the listener thread does the blocking writes
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+    log_queue = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(log_queue, handler)
+    _log_listener.start()
+
+    # Configure root logger. Not via basicConfig, which would give the QueueHandler a
+    # formatter of its own and format every record twice
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+        existing.close()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(getattr(logging, log_level, logging.INFO))
 
     return logging.getLogger(__name__)
 
 
 def main():
     """Main entry point for the MCP Monumenten Server"""
-    load_dotenv()
-
     parser = argparse.ArgumentParser(description="MCP Monumenten Server")
     parser.add_argument(
         "--name", default="Monumenten MCP", help="Name for the MCP server"
@@ -80,6 +99,14 @@ def main():
 
     args = parser.parse_args()
 
+    # Deferred so that --help and argument errors skip the filesystem and heavy imports
+    import anyio
+    from dotenv import load_dotenv
+
+    from mcp_monumenten.server import MonumentenMCP
+
+    load_dotenv()
+
     # Setup logging based on transport mode
     transport_mode = "http" if args.http else "stdio"
     logger = setup_logging(transport_mode)
@@ -90,31 +117,43 @@ def main():
         "name": args.name,
         "host": args.host,
         "stateless_http": args.stateless,
+        **({"port": args.port} if args.http else {}),
     }
 
-    # Only add port if we're using HTTP transport
-    if args.http:
-        server_kwargs["port"] = args.port
-
     mcp = MonumentenMCP(**server_kwargs)
 
     # Log configuration info
     logger.info("Starting MCP Monumenten Server")
-    logger.info(f"Name: {args.name}")
-    logger.info(f"Transport: {'HTTP' if args.http else 'stdio'}")
+    logger.info("Name: %s", args.name)
+    logger.info("Transport: %s", "HTTP" if args.http else "stdio")
     if args.http:
-        logger.info(f"Host: {args.host}:{args.port}")
-        logger.info(f"Stateless: {args.stateless}")
+        logger.info("Host: %s:%s", args.host, args.port)
+        logger.info("Stateless: %s", args.stateless)
 
-    # Run the server
+    # Use uvloop when available. It is passed to anyio as a loop factory rather than
+    # installed as the global policy, since uvloop.install() is deprecated on Python 3.12+
     try:
-        mcp.run(transport="streamable-http" if args.http else "stdio")
+        import uvloop
+
+        backend_options = {"loop_factory": uvloop.new_event_loop}
+    except ImportError:
+        backend_options = {}
+
+    # Run the server; equivalent to mcp.run(), but with the loop factory above
+    try:
+        anyio.run(
+            mcp.run_streamable_http_async if args.http else mcp.run_stdio_async,
+            backend_options=backend_options,
+        )
     except KeyboardInterrupt:
         logger.info("Shutting down server...")
     finally:
         # Clean up the server resources
         if hasattr(mcp, "close"):
             asyncio.run(mcp.close())
+        # Flush any queued log records
+        if _log_listener is not None:
+            _log_listener.stop()
 
 
 if __name__ == "__main__":
@@ -1,11 +1,147 @@
-import json
+import asyncio
+import csv
+import io
+import logging
+import re
+import string
+import time
 from typing import Annotated, Optional
 
 import aiohttp
+import anyio
+import orjson
+from async_lru import alru_cache
 from mcp.server.fastmcp import FastMCP
 from mcp.types import ToolAnnotations
 from monumenten import MonumentenClient
 
+logger = logging.getLogger(__name__)
+
+KADASTER_SPARQL_ENDPOINT = "https://data.kkg.kadaster.nl/service/sparql"
+
+# How long SPARQL results stay cached; BAG addresses change on the scale of days
+_QUERY_CACHE_TTL = 6 * 60 * 60  # seconds
+
+# Seconds to wait after a failed warmup before a later address lookup tries again
+_WARMUP_RETRY_DELAY = 15 * 60
+
+# Per-request timeout and retry policy for the Kadaster endpoint
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=3)
+_RETRY_ATTEMPTS = 3
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_RETRY_BACKOFF = 0.5  # seconds, doubled after every attempt
+
+# Response size in bytes above which results are parsed off the event loop
+_THREAD_PARSE_THRESHOLD = 32_768
+
+# Dutch postal code, e.g. "1234AB" or "1234 ab"
+_POSTCODE_RE = re.compile(r'^\s*(\d{4})\s*([A-Z]{2})\s*$', re.I | re.A)
+
+# House number, inserted unquoted as an integer literal; ASCII only, as str.isdigit()
+# also accepts characters such as '²' that are not valid in SPARQL
+_HOUSE_NUMBER_RE = re.compile(r'\d+', re.A)
+
+# Row limit for the first lookup, enough to distinguish a single match from an ambiguous one
+_PROBE_LIMIT = 2
+
+# (output key, SELECT variable / CSV column) pairs for each row returned by get_verblijfsobject_id
+_RESULT_KEYS = (
+    ('bag_verblijfsobject_id', 'identificatie'),
+    ('postcode', 'postcode'),
+    ('huisnummer', 'huisnummer'),
+    ('huisletter', 'huisletter'),
+    ('huisnummertoevoeging', 'huisnummertoevoeging'),
+    ('straatnaam', 'straatnaam'),
+    ('plaatsnaam', 'plaatsnaam'),
+)
+
+# Filters excluding addresses with a house letter/suffix, keyed on whether one was given
+_LETTER_FILTER = {
+    True: '',
+    False: 'FILTER NOT EXISTS { ?adres imx:huisletter ?_hl . }',
+}
+_SUFFIX_FILTER = {
+    True: '',
+    False: 'FILTER NOT EXISTS { ?adres imx:huisnummertoevoeging ?_hs . FILTER(?_hs != "H") }',
+}
+
+_POSTAL_TPL = string.Template("""
+PREFIX prov: <http://www.w3.org/ns/prov#>
+PREFIX imx:  <http://modellen.geostandaarden.nl/def/imx-geo#>
+
+SELECT DISTINCT ?identificatie ?postcode ?huisnummer ?huisletter ?huisnummertoevoeging ?straatnaam ?plaatsnaam
+WHERE {
+  ?adres prov:wasDerivedFrom ?verblijfsobjectIri ;
+         imx:isHoofdadres true ;
+         imx:postcode "$postal_code" ;
+         imx:huisnummer $house_number .
+  
+  $letter_clause
+  $suffix_clause
+
+  $letter_filter
+  $suffix_filter
+
+  OPTIONAL { ?adres imx:postcode ?postcode . }
+  OPTIONAL { ?adres imx:huisnummer ?huisnummer . }
+  OPTIONAL { ?adres imx:huisletter ?huisletter . }
+  OPTIONAL { ?adres imx:huisnummertoevoeging ?huisnummertoevoeging . }
+  OPTIONAL { ?adres imx:straatnaam ?straatnaam . }
+  OPTIONAL { ?adres imx:plaatsnaam ?plaatsnaam . }
+
+  BIND(STRAFTER(STR(?verblijfsobjectIri), "https://bag.basisregistraties.overheid.nl/id/verblijfsobject/") AS ?identificatie)
+}
+""".strip())
+
+_ADDR_TPL = string.Template("""
+PREFIX prov: <http://www.w3.org/ns/prov#>
+PREFIX imx:  <http://modellen.geostandaarden.nl/def/imx-geo#>
+
+SELECT DISTINCT ?identificatie ?postcode ?huisnummer ?huisletter ?huisnummertoevoeging ?straatnaam ?plaatsnaam
+WHERE {
+  ?adres prov:wasDerivedFrom ?verblijfsobjectIri ;
+         imx:isHoofdadres true ;
+         imx:straatnaam "$street" ;
+         imx:huisnummer $house_number ;
+         imx:plaatsnaam "$city" .
+  
+  $letter_clause
+  $suffix_clause
+
+  $letter_filter
+  $suffix_filter
+
+  OPTIONAL { ?adres imx:straatnaam ?straatnaam . }
+  OPTIONAL { ?adres imx:huisnummer ?huisnummer . }
+  OPTIONAL { ?adres imx:plaatsnaam ?plaatsnaam . }
+  OPTIONAL { ?adres imx:huisletter ?huisletter . }
+  OPTIONAL { ?adres imx:huisnummertoevoeging ?huisnummertoevoeging . }
+  OPTIONAL { ?adres imx:postcode ?postcode . }
+
+  BIND(STRAFTER(STR(?verblijfsobjectIri), "https://bag.basisregistraties.overheid.nl/id/verblijfsobject/") AS ?identificatie)
+}
+""".strip())
+
+
+def _sparql_escape(value: str) -> str:
+    """Escape a value for use inside a double-quoted SPARQL string literal."""
+    return (
+        value.replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _parse_rows(body: bytes, prefer_json: bool) -> list[dict]:
+    """Parse a SPARQL CSV (or JSON) results body into {variable: value} dicts."""
+    if prefer_json:
+        result = orjson.loads(body)
+        bindings = result.get('results', {}).get('bindings', [])
+        return [{k: v.get('value') for k, v in b.items()} for b in bindings]
+    # CSV has no notion of unbound values; they come through as empty strings
+    return [{k: v or None for k, v in row.items()} for row in csv.DictReader(io.StringIO(body.decode()))]
+
 
 class MonumentenMCP(FastMCP):
     def __init__(self, name: str = "Monumenten MCP", port: int | None = None, host: str = "127.0.0.1",
@@ -17,7 +153,188 @@ class MonumentenMCP(FastMCP):
             fastmcp_kwargs["port"] = port
 
         super().__init__(**fastmcp_kwargs)
+        self._session: aiohttp.ClientSession | None = None
+        self._session_lock = asyncio.Lock()
+        self._mon_client: MonumentenClient | None = None
+        self._mon_client_lock = asyncio.Lock()
+        self._warmup_task: asyncio.Task | None = None
+        self._warmup_failed_at: float | None = None
+        # Per-instance cache keyed on the query text, which is deterministic for normalized inputs
+        self._cached_query = alru_cache(maxsize=4096, ttl=_QUERY_CACHE_TTL)(self._query_kadaster)
         self._register_tools()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        async with self._session_lock:
+            if self._session is None or self._session.closed:
+                # Keep connections to the Kadaster and RCE endpoints alive, and fall back from
+                # IPv6 to IPv4 quickly instead of stalling on a broken dual-stack route. The
+                # session is shared with the MonumentenClient, so it keeps aiohttp's default
+                # timeout; Kadaster lookups from this module set their own per request.
+                self._session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(
+                        limit=100,
+                        limit_per_host=20,
+                        use_dns_cache=True,
+                        ttl_dns_cache=300,
+                        happy_eyeballs_delay=0.25,
+                        keepalive_timeout=75,
+                        force_close=False,
+                    ),
+                    raise_for_status=False,
+                    trust_env=True,
+                )
+            return self._session
+
+    async def _get_mon_client(self) -> MonumentenClient:
+        """Return the shared MonumentenClient, entering it on first use.
+
+        The client uses the shared HTTP session, so it reuses the pooled connections.
+        """
+        async with self._mon_client_lock:
+            if self._mon_client is None:
+                session = await self._get_session()
+                self._mon_client = await MonumentenClient(session=session).__aenter__()
+            return self._mon_client
+
+    def _ensure_warmup(self):
+        """Prepare get_monumental_status in the background, alongside an address lookup."""
+        if self._warmup_task is not None:
+            return
+        # After a failure, wait before trying again rather than retrying on every lookup
+        if (
+            self._warmup_failed_at is not None
+            and time.monotonic() - self._warmup_failed_at < _WARMUP_RETRY_DELAY
+        ):
+            return
+        self._warmup_task = asyncio.create_task(self._warm_up_status_lookup())
+        self._warmup_task.add_done_callback(self._on_warmup_done)
+
+    async def _warm_up_status_lookup(self):
+        # Every status lookup first needs the protected cityscapes from the RCE, which
+        # monumenten downloads once and caches for a week. Fetching them now also opens
+        # a pooled connection to the RCE endpoint. This is a private monumenten helper,
+        # written against monumenten 0.4.0 and called as _get_beschermde_gezichten(session);
+        # skip the warmup if it is not available. Any other failure, e.g. a changed
+        # signature, is logged and backed off by _on_warmup_done.
+        try:
+            from monumenten._processing import _get_beschermde_gezichten
+        except ImportError:
+            logger.debug("monumenten has no _get_beschermde_gezichten, skipping warmup")
+            return
+        await _get_beschermde_gezichten(await self._get_session())
+
+    def _on_warmup_done(self, task: asyncio.Task):
+        # A failed warmup is retried after _WARMUP_RETRY_DELAY; get_monumental_status
+        # reports its own errors
+        if task.cancelled():
+            self._warmup_task = None
+        elif task.exception() is not None:
+            logger.warning(
+                "Warming up the monumental status lookup failed, retrying in %d s: %r",
+                _WARMUP_RETRY_DELAY, task.exception(),
+            )
+            self._warmup_failed_at = time.monotonic()
+            self._warmup_task = None
+
+    async def _post_sparql(self, sparql_query: str, accept: str) -> bytes:
+        """POST a query to the Kadaster endpoint and return the raw response body.
+
+        Transient gateway errors are retried with exponential backoff; any other error status
+        raises aiohttp.ClientResponseError.
+        """
+        session = await self._get_session()
+        # aiohttp form-encodes the dict and sets the Content-Type itself
+        headers = {'Accept': accept}
+        data = {'query': sparql_query}
+
+        def post():
+            return session.post(
+                KADASTER_SPARQL_ENDPOINT, headers=headers, data=data, timeout=_REQUEST_TIMEOUT
+            )
+
+        for attempt in range(1, _RETRY_ATTEMPTS):
+            async with post() as response:
+                if response.status not in _RETRY_STATUSES:
+                    response.raise_for_status()
+                    return await response.read()
+            logger.warning(
+                "Kadaster endpoint returned HTTP %s, retrying (attempt %d of %d)",
+                response.status, attempt + 1, _RETRY_ATTEMPTS,
+            )
+            await asyncio.sleep(_RETRY_BACKOFF * 2 ** (attempt - 1))
+
+        # Final attempt: any error status, including a gateway error, is raised
+        async with post() as response:
+            response.raise_for_status()
+            return await response.read()
+
+    async def _query_kadaster(self, sparql_query: str, prefer_json: bool = False) -> list[dict]:
+        """Run a SPARQL query against the Kadaster endpoint and return the rows as {variable: value} dicts.
+
+        Results are requested as CSV, which avoids the per-cell wrappers of the JSON results
+        format. Set prefer_json to request SPARQL JSON instead, e.g. for debugging.
+        """
+        # Use lazy %-formatting so the query text is only formatted when DEBUG is enabled
+        logger.debug("Kadaster SPARQL query:\n%s", sparql_query)
+        body = await self._post_sparql(
+            sparql_query, 'application/sparql-results+json' if prefer_json else 'text/csv'
+        )
+
+        # Parse large (very ambiguous) results in a thread so other tool calls are not blocked
+        if len(body) > _THREAD_PARSE_THRESHOLD:
+            return await asyncio.to_thread(_parse_rows, body, prefer_json)
+        return _parse_rows(body, prefer_json)
+
+    async def run_stdio_async(self) -> None:
+        try:
+            await super().run_stdio_async()
+        finally:
+            await self._close_on_shutdown()
+
+    async def run_sse_async(self, mount_path: str | None = None) -> None:
+        try:
+            await super().run_sse_async(mount_path)
+        finally:
+            await self._close_on_shutdown()
+
+    async def run_streamable_http_async(self) -> None:
+        try:
+            await super().run_streamable_http_async()
+        finally:
+            await self._close_on_shutdown()
+
+    async def _close_on_shutdown(self):
+        # Close on the serving loop, where the pooled connections live; shielded so that
+        # the cancellation that stopped the server does not interrupt the cleanup
+        with anyio.CancelScope(shield=True):
+            await self.close()
+
+    async def _lookup(self, sparql_query: str) -> list[dict]:
+        """Run a SPARQL query through the cache, without remembering empty results."""
+        rows = await self._cached_query(sparql_query)
+        if not rows:
+            # A miss may be a typo that gets corrected, or an address that is added to the BAG later
+            self._cached_query.cache_invalidate(sparql_query)
+        return rows
+
+    async def close(self):
+        """Close the shared HTTP session and MonumentenClient.
+
+        The run_*_async methods call this when the server stops. Calling it again is a
+        no-op, so the extra call in __main__ is only a fallback.
+        """
+        self._cached_query.cache_clear()
+        if self._warmup_task is not None and not self._warmup_task.done():
+            self._warmup_task.cancel()
+        self._warmup_task = None
+        # The client does not own the shared session, so close that last
+        if self._mon_client is not None:
+            await self._mon_client.__aexit__(None, None, None)
+        self._mon_client = None
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
         
     
     def _register_tools(self):
@@ -38,153 +355,88 @@ class MonumentenMCP(FastMCP):
             house_suffix: Annotated[Optional[str], "The house number suffix/addition, e.g. '2' in '30-2'"] = None
         ) -> str:
             """Get verblijfsobject ID using address. Use postal_code + house_number OR street + house_number + city. Additional filters like house_letter and house_suffix can be provided for more precise matching."""
-            
             # Validate input combinations
             if postal_code and (street or city):
                 return "Error: Provide either postal_code OR (street + city), not both."
             
             if postal_code:
                 # Mode 1: Search by postal code + house number
-                if not postal_code.strip():
-                    return "Error: postal_code cannot be empty when using postal code search."
+                match = _POSTCODE_RE.match(postal_code)
+                if not match:
+                    return "Error: postal_code must be a Dutch postal code of 4 digits and 2 letters, e.g. '1234AB'."
+                postal_code = f"{match.group(1)}{match.group(2).upper()}"
                 search_mode = "postal_code"
                 
             elif street and city:
                 # Mode 2: Search by street + house number + city
-                if not street.strip() or not city.strip():
+                street, city = street.strip(), city.strip()
+                if not street or not city:
                     return "Error: street and city cannot be empty when using address search."
                 search_mode = "address"
                 
             else:
                 return "Error: Provide either (postal_code + house_number) OR (street + house_number + city)."
 
-            # Build SPARQL query based on search mode
-            if search_mode == "postal_code":
-                # Build conditional parts
-                letter_clause = f'?adres imx:huisletter "{house_letter}" .' if house_letter else ''
-                suffix_clause = f'?adres imx:huisnummertoevoeging "{house_suffix}" .' if house_suffix else ''
-                letter_filter = '' if house_letter else 'FILTER NOT EXISTS { ?adres imx:huisletter ?_hl . }'
-                suffix_filter = '' if house_suffix else 'FILTER NOT EXISTS { ?adres imx:huisnummertoevoeging ?_hs . FILTER(?_hs != "H") }'
-                letter_bind = 'OPTIONAL { ?adres imx:huisletter ?huisletter . }'
-                suffix_bind = 'OPTIONAL { ?adres imx:huisnummertoevoeging ?huisnummertoevoeging . }'
-                
-                sparql_query = f"""
-PREFIX prov: <http://www.w3.org/ns/prov#>
-PREFIX imx:  <http://modellen.geostandaarden.nl/def/imx-geo#>
-
-SELECT DISTINCT ?identificatie ?postcode ?huisnummer ?huisletter ?huisnummertoevoeging ?straatnaam ?plaatsnaam
-WHERE {{
-  ?adres prov:wasDerivedFrom ?verblijfsobjectIri ;
-         imx:isHoofdadres true ;
-         imx:postcode "{postal_code}" ;
-         imx:huisnummer {house_number} .
-  
-  {letter_clause}
-  {suffix_clause}
-
-  {letter_filter}
-  {suffix_filter}
+            # house_number is inserted as an integer literal, so it cannot be escaped
+            house_number = house_number.strip()
+            if not _HOUSE_NUMBER_RE.fullmatch(house_number):
+                return "Error: house_number must be a number, e.g. '30'. Use house_letter and house_suffix for additions."
+            house_letter = house_letter.strip() if house_letter else None
+            house_suffix = house_suffix.strip() if house_suffix else None
 
-  OPTIONAL {{ ?adres imx:postcode ?postcode . }}
-  OPTIONAL {{ ?adres imx:huisnummer ?huisnummer . }}
-  {letter_bind}
-  {suffix_bind}
-  OPTIONAL {{ ?adres imx:straatnaam ?straatnaam . }}
-  OPTIONAL {{ ?adres imx:plaatsnaam ?plaatsnaam . }}
+            # The status lookup usually follows, so prepare it alongside this query
+            self._ensure_warmup()
 
-  BIND(STRAFTER(STR(?verblijfsobjectIri), "https://bag.basisregistraties.overheid.nl/id/verblijfsobject/") AS ?identificatie)
-}}
-""".strip()
-            
+            # Build SPARQL query based on search mode
+            clauses = {
+                "letter_clause": f'?adres imx:huisletter "{_sparql_escape(house_letter)}" .' if house_letter else '',
+                "suffix_clause": f'?adres imx:huisnummertoevoeging "{_sparql_escape(house_suffix)}" .' if house_suffix else '',
+                "letter_filter": _LETTER_FILTER[bool(house_letter)],
+                "suffix_filter": _SUFFIX_FILTER[bool(house_suffix)],
+            }
+            if search_mode == "postal_code":
+                sparql_query = _POSTAL_TPL.substitute(
+                    clauses, postal_code=_sparql_escape(postal_code), house_number=house_number
+                )
             else:  # address mode
-                # Build conditional parts
-                letter_clause = f'?adres imx:huisletter "{house_letter}" .' if house_letter else ''
-                suffix_clause = f'?adres imx:huisnummertoevoeging "{house_suffix}" .' if house_suffix else ''
-                letter_filter = '' if house_letter else 'FILTER NOT EXISTS { ?adres imx:huisletter ?_hl . }'
-                suffix_filter = '' if house_suffix else 'FILTER NOT EXISTS { ?adres imx:huisnummertoevoeging ?_hs . FILTER(?_hs != "H") }'
-                letter_bind = 'OPTIONAL { ?adres imx:huisletter ?huisletter . }'
-                suffix_bind = 'OPTIONAL { ?adres imx:huisnummertoevoeging ?huisnummertoevoeging . }'
-                
-                sparql_query = f"""
-PREFIX prov: <http://www.w3.org/ns/prov#>
-PREFIX imx:  <http://modellen.geostandaarden.nl/def/imx-geo#>
-
-SELECT DISTINCT ?identificatie ?postcode ?huisnummer ?huisletter ?huisnummertoevoeging ?straatnaam ?plaatsnaam
-WHERE {{
-  ?adres prov:wasDerivedFrom ?verblijfsobjectIri ;
-         imx:isHoofdadres true ;
-         imx:straatnaam "{street}" ;
-         imx:huisnummer {house_number} ;
-         imx:plaatsnaam "{city}" .
-  
-  {letter_clause}
-  {suffix_clause}
-
-  {letter_filter}
-  {suffix_filter}
-
-  OPTIONAL {{ ?adres imx:straatnaam ?straatnaam . }}
-  OPTIONAL {{ ?adres imx:huisnummer ?huisnummer . }}
-  OPTIONAL {{ ?adres imx:plaatsnaam ?plaatsnaam . }}
-  {letter_bind}
-  {suffix_bind}
-  OPTIONAL {{ ?adres imx:postcode ?postcode . }}
-
-  BIND(STRAFTER(STR(?verblijfsobjectIri), "https://bag.basisregistraties.overheid.nl/id/verblijfsobject/") AS ?identificatie)
-}}
-""".strip()
+                sparql_query = _ADDR_TPL.substitute(
+                    clauses, street=_sparql_escape(street), house_number=house_number, city=_sparql_escape(city)
+                )
 
             # Execute SPARQL query against Kadaster endpoint
-            endpoint_url = "https://data.kkg.kadaster.nl/service/sparql"
-            
-            headers = {
-                'Accept': 'application/sparql-results+json',
-                'Content-Type': 'application/x-www-form-urlencoded'
-            }
-            
-            data = {'query': sparql_query}
-            
+            # Two rows are enough to tell a unique match from an ambiguous one; only
+            # fetch the full result set when it is needed for the ambiguity message
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(endpoint_url, headers=headers, data=data) as response:
-                        if response.status == 200:
-                            result = await response.json()
-                            bindings = result.get('results', {}).get('bindings', [])
-
-                            if bindings:
-                                def get_val(b, k):
-                                    return b.get(k, {}).get('value')
-                                full = [
-                                    {
-                                        'bag_verblijfsobject_id': get_val(b, 'identificatie'),
-                                        'postcode': get_val(b, 'postcode'),
-                                        'huisnummer': get_val(b, 'huisnummer'),
-                                        'huisletter': get_val(b, 'huisletter'),
-                                        'huisnummertoevoeging': get_val(b, 'huisnummertoevoeging'),
-                                        'straatnaam': get_val(b, 'straatnaam'),
-                                        'plaatsnaam': get_val(b, 'plaatsnaam'),
-                                    }
-                                    for b in bindings
-                                ]
-                                ids = [item['bag_verblijfsobject_id'] for item in full if item['bag_verblijfsobject_id']]
-                                if not ids:
-                                    if search_mode == "postal_code":
-                                        return f"No verblijfsobject found for postal code {postal_code}, house number {house_number}"
-                                    else:
-                                        return f"No verblijfsobject found for address: {street} {house_number}, {city}. Postal code + house number usually works better."
-                                if len(ids) == 1:
-                                    return f"{json.dumps(full, ensure_ascii=False)}"
-                               
-                                return f"Ambiguous address: multiple results found: {json.dumps(full, ensure_ascii=False)}"
-                            else:
-                                if search_mode == "postal_code":
-                                    return f"No verblijfsobject found for postal code {postal_code}, house number {house_number}"
-                                else:
-                                    return f"No verblijfsobject found for address: {street} {house_number}, {city}. Postal code + house number usually works better."
-                        else:
-                            return f"Error querying Kadaster endpoint: HTTP {response.status}"
-            except Exception as e:
+                rows = await self._lookup(f"{sparql_query}\nLIMIT {_PROBE_LIMIT}")
+                if len(rows) == _PROBE_LIMIT:
+                    rows = await self._lookup(sparql_query)
+            except aiohttp.ClientResponseError as e:
+                if e.status == 429:
+                    return "Error: Kadaster endpoint is rate limiting requests (HTTP 429). Wait before trying again."
+                return f"Error querying Kadaster endpoint: HTTP {e.status}"
+            except asyncio.TimeoutError:
+                return "Error: Kadaster endpoint did not respond in time. Try again later."
+            except aiohttp.ClientConnectionError as e:
+                return f"Error connecting to Kadaster endpoint: {str(e)}"
+            except aiohttp.ClientError as e:
                 return f"Error executing SPARQL query: {str(e)}"
+            except (ValueError, csv.Error) as e:
+                # Malformed body, e.g. a UnicodeDecodeError or orjson.JSONDecodeError
+                return f"Error: unexpected response from Kadaster endpoint: {str(e)}"
+
+            if rows:
+                full = [{out: row.get(src) for out, src in _RESULT_KEYS} for row in rows]
+                ids = [row['identificatie'] for row in rows if row.get('identificatie')]
+                if ids:
+                    if len(ids) == 1:
+                        return f"{orjson.dumps(full).decode()}"
+
+                    return f"Ambiguous address: multiple results found: {orjson.dumps(full).decode()}"
+
+            if search_mode == "postal_code":
+                return f"No verblijfsobject found for postal code {postal_code}, house number {house_number}"
+            else:
+                return f"No verblijfsobject found for address: {street} {house_number}, {city}. Postal code + house number usually works better."
             
         @self.tool(
             annotations=ToolAnnotations(
@@ -193,9 +445,16 @@ WHERE {{
                 openWorldHint=True,
             ))
         async def get_monumental_status(
-            bag_verblijfsobject_id: Annotated[str, "The verblijfsobject ID (16-18 digits)"]
+            bag_verblijfsobject_ids: Annotated[str | list[str], "One or more verblijfsobject IDs (16-18 digits each)"]
         ) -> str:
-            """Get the monumental status of a verblijfsobject. Always mention the source for the Rijksmonument status if it is a Rijksmonument. (RCE = Rijksdienst voor het Cultureel Erfgoed.)"""
-            async with MonumentenClient() as client:
-                result = await client.process_from_list([bag_verblijfsobject_id])
-                return json.dumps(result, indent=2)
+            """Get the monumental status of one or more verblijfsobjecten. Pass all IDs in a single call when checking several addresses. Always mention the source for the Rijksmonument status if it is a Rijksmonument. (RCE = Rijksdienst voor het Cultureel Erfgoed.)"""
+            if isinstance(bag_verblijfsobject_ids, str):
+                bag_verblijfsobject_ids = [bag_verblijfsobject_ids]
+            ids = list(dict.fromkeys(bag_verblijfsobject_ids))
+            if not ids:
+                return "Error: Provide at least one bag_verblijfsobject_id."
+
+            # monumenten batches large lists itself and runs the batches concurrently
+            client = await self._get_mon_client()
+            result = await client.process_from_list(ids)
+            return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()